@@ -12,9 +12,8 @@
 import numpy as np
 import os
 import datetime
-from scipy import interpolate, integrate
+from scipy import interpolate, integrate, optimize
 from rosco.toolbox.utilities import list_check
-from scipy import optimize
 
 # Some useful constants
 now = datetime.datetime.now()
@@ -199,7 +198,7 @@ class Controller():
         J = turbine.J                           # Total rotor inertial (kg-m^2) 
         rho = turbine.rho                       # Air density (kg/m^3)
         R = turbine.rotor_radius                    # Rotor radius (m)
-        Ar = np.pi*R**2                         # Rotor area (m^2)
+        Ar = turbine.rotor_area                 # Rotor area (m^2)
         Ng = turbine.Ng                         # Gearbox ratio (-)
         rated_rotor_speed = turbine.rated_rotor_speed               # Rated rotor speed (rad/s)
 
@@ -214,83 +213,76 @@ class Controller():
         v_below_rated = np.linspace(turbine.v_min,turbine.v_rated, num=self.WS_GS_n-self.PC_GS_n)[:-1]             # below rated
         v_above_rated = np.linspace(turbine.v_rated,turbine.v_max, num=self.PC_GS_n+1)             # above rated
         v = np.concatenate((v_below_rated, v_above_rated))
+        n_br = len(v_below_rated)     # number of below rated operating points, above rated gain scheduling starts at n_br+1
 
-        # separate TSRs by operations regions
-        TSR_below_rated = [min(turbine.TSR_operational, rated_rotor_speed*R/v) for v in v_below_rated] # below rated     
-        TSR_above_rated = rated_rotor_speed*R/v_above_rated                     # above rated
-        TSR_op = np.concatenate((TSR_below_rated, TSR_above_rated))             # operational TSRs
+        # operational TSRs, filled in place by operation region
+        TSR_op = rated_rotor_speed*R/v                                          # above rated
+        TSR_op[:n_br] = np.minimum(turbine.TSR_operational, TSR_op[:n_br])      # below rated
 
-        # Find expected operational Cp values
-        Cp_above_rated = turbine.Cp.interp_surface(0,TSR_above_rated[0])     # Cp during rated operation (not optimal). Assumes cut-in bld pitch to be 0
-        Cp_op_br = np.ones(len(v_below_rated)) * turbine.Cp.max              # below rated
-        Cp_op_ar = Cp_above_rated * (TSR_above_rated/TSR_rated)**3           # above rated
-        Cp_op = np.concatenate((Cp_op_br, Cp_op_ar))                         # operational CPs to linearize around
+        # Find expected operational Cp values to linearize around
+        Cp_above_rated = turbine.Cp.interp_surface(0,TSR_op[n_br])     # Cp during rated operation (not optimal). Assumes cut-in bld pitch to be 0
+        Cp_op = np.full(len(v), turbine.Cp.max)                         # below rated
+        Cp_op[n_br:] = Cp_above_rated * (TSR_op[n_br:]/TSR_rated)**3    # above rated
         pitch_initial_rad = turbine.pitch_initial_rad
         TSR_initial = turbine.TSR_initial
 
-        # initialize variables
-        pitch_op    = np.empty(len(TSR_op))
-        dCp_beta    = np.empty(len(TSR_op))
-        dCp_TSR     = np.empty(len(TSR_op))
-        dCt_beta    = np.empty(len(TSR_op))
-        dCt_TSR     = np.empty(len(TSR_op))
-        Ct_op       = np.empty(len(TSR_op))
-
         # ------------- Find Linearized State "Matrices" ------------- #
-        # At each operating point
-        for i in range(len(TSR_op)):
-            # Find pitch angle as a function of expected operating CP for each TSR operating point
-            Cp_TSR = np.ndarray.flatten(turbine.Cp.interp_surface(turbine.pitch_initial_rad, TSR_op[i]))     # all Cp values for a given tsr
-            Cp_maxidx = Cp_TSR.argmax()    
-            Cp_op[i] = np.clip(Cp_op[i], np.min(Cp_TSR[Cp_maxidx:]), np.max(Cp_TSR[Cp_maxidx:]))            # saturate Cp values to be on Cp surface                                                             # Find maximum Cp value for this TSR
-            f_cp_pitch = interpolate.interp1d(Cp_TSR[Cp_maxidx:],pitch_initial_rad[Cp_maxidx:])             # interpolate function for Cp(tsr) values
-            
-            # expected operational blade pitch values. Saturates by min_pitch if it exists
-            if v[i] <= turbine.v_rated and isinstance(self.min_pitch, float): # Below rated & defined min_pitch
-                pitch_op[i] = min(self.min_pitch, f_cp_pitch(Cp_op[i]))
-            elif isinstance(self.min_pitch, float):                           # above rated & defined min_pitch
-                pitch_op[i] = max(self.min_pitch, f_cp_pitch(Cp_op[i]))             
-            else:                                                             # no defined minimum pitch schedule
-                pitch_op[i] = f_cp_pitch(Cp_op[i])     
-
-            # Calculate Cp Surface gradients
-            dCp_beta[i], dCp_TSR[i] = turbine.Cp.interp_gradient(pitch_op[i],TSR_op[i]) 
-            dCt_beta[i], dCt_TSR[i] = turbine.Ct.interp_gradient(pitch_op[i],TSR_op[i]) 
-        
-            # Thrust
-            Ct_TSR      = np.ndarray.flatten(turbine.Ct.interp_surface(turbine.pitch_initial_rad, TSR_op[i]))     # all Cp values for a given tsr
-            f_ct        = interpolate.interp1d(pitch_initial_rad,Ct_TSR)
-            Ct_op[i]    = f_ct(pitch_op[i])
-            Ct_op[i]    = np.clip(Ct_op[i], np.min(Ct_TSR), np.max(Ct_TSR))        # saturate Ct values to be on Ct surface
-
+        # Cp and Ct values for all pitch angles at each TSR operating point, [len(TSR_op) x len(pitch_initial_rad)]
+        Cp_grid = turbine.Cp.interp_surface(pitch_initial_rad, TSR_op)
+        Ct_grid = turbine.Ct.interp_surface(pitch_initial_rad, TSR_op)
+
+        # Find pitch angle as a function of expected operating CP for each TSR operating point
+        #   - only the part of each Cp(pitch) curve beyond the Cp-maximizing pitch angle is used
+        Cp_maxidx = Cp_grid.argmax(axis=1)
+        past_max = np.arange(len(pitch_initial_rad)) >= Cp_maxidx[:,np.newaxis]
+        Cp_op = np.clip(Cp_op, np.min(Cp_grid, axis=1, where=past_max, initial=np.inf), np.max(Cp_grid, axis=1))   # saturate Cp values to be on Cp surface
+        pitch_cp = np.array([interp_unsorted(Cp_op[i], Cp_grid[i,j:], pitch_initial_rad[j:]) for i, j in enumerate(Cp_maxidx)])
+
+        # expected operational blade pitch values. Saturates by min_pitch if it exists
+        if isinstance(self.min_pitch, float):   # below rated: min(min_pitch, pitch), above rated: max(min_pitch, pitch)
+            pitch_op = np.where(v <= turbine.v_rated, np.minimum(self.min_pitch, pitch_cp), np.maximum(self.min_pitch, pitch_cp))
+        else:                                   # no defined minimum pitch schedule
+            pitch_op = pitch_cp
+
+        # Calculate Cp Surface gradients
+        dCp_beta, dCp_TSR = turbine.Cp.interp_gradient(pitch_op,TSR_op) 
+        dCt_beta, dCt_TSR = turbine.Ct.interp_gradient(pitch_op,TSR_op) 
+
+        # Thrust
+        Ct_op = np.array([np.interp(pitch_op[i], pitch_initial_rad, Ct_grid[i]) for i in range(len(TSR_op))])
+        Ct_op = np.clip(Ct_op, np.min(Ct_grid, axis=1), np.max(Ct_grid, axis=1))     # saturate Ct values to be on Ct surface
 
         # Define minimum pitch saturation to be at Cp-maximizing pitch angle if not specifically defined
         if not isinstance(self.min_pitch, float):
             self.min_pitch = pitch_op[0]
 
-        # Full Cx surface gradients
-        dCp_dbeta   = dCp_beta/np.diff(pitch_initial_rad)[0]
-        dCp_dTSR    = dCp_TSR/np.diff(TSR_initial)[0]
-        dCt_dbeta   = dCt_beta/np.diff(pitch_initial_rad)[0]
-        dCt_dTSR    = dCt_TSR/np.diff(TSR_initial)[0]
+        # Full Cx surface gradients, table gradients are per grid step so scale by the (uniform) grid spacing
+        dpitch      = pitch_initial_rad[1] - pitch_initial_rad[0]
+        dTSR        = TSR_initial[1] - TSR_initial[0]
+        dCp_dbeta   = dCp_beta/dpitch
+        dCp_dTSR    = dCp_TSR/dTSR
+        dCt_dbeta   = dCt_beta/dpitch
+        dCt_dTSR    = dCt_TSR/dTSR
         
         # Linearized system derivatives, equations from https://wes.copernicus.org/articles/7/53/2022/wes-7-53-2022.pdf
-        dtau_dbeta      = Ng/2*rho*Ar*R*(1/TSR_op)*dCp_dbeta*v**2  # (26)
-        dtau_dlambda    = Ng/2*rho*Ar*R*v**2*(1/(TSR_op**2))*(dCp_dTSR*TSR_op - Cp_op)   # (7)
+        qA              = 1/2 * rho * Ar * v**2         # Dynamic pressure times rotor area at each wind speed (N)
+        tau_TSR         = Ng*R*qA/TSR_op                # Common factor of the torque derivatives, Ng/2*rho*Ar*R*v**2/TSR_op
+        dtau_dbeta      = tau_TSR*dCp_dbeta  # (26)
+        dtau_dlambda    = tau_TSR*(dCp_dTSR - Cp_op/TSR_op)   # (7)
         dlambda_domega  = R/v/Ng
         dtau_domega     = dtau_dlambda*dlambda_domega
         dlambda_dv      = -(TSR_op/v)
 
-        Pi_beta         = 1/2 * rho * Ar * v**2 * dCt_dbeta
+        Pi_beta         = qA * dCt_dbeta
         Pi_omega        = 1/2 * rho * Ar * R * v * dCt_dTSR
-        Pi_wind         = 1/2 * rho * Ar * v**2 * dCt_dTSR * dlambda_dv + rho * Ar * v * Ct_op
+        Pi_wind         = qA * dCt_dTSR * dlambda_dv + rho * Ar * v * Ct_op
 
         # Second order system coefficients
         if not self.VS_ConstPower:       # Constant torque above rated
             A = dtau_domega/J
         else:                            # Constant power above rated
             A = dtau_domega/J 
-            A[-len(v_above_rated)+1:] += Ng**2/J * turbine.rated_power/(Ng**2*rated_rotor_speed**2)
+            A[n_br+1:] += Ng**2/J * turbine.rated_power/(Ng**2*rated_rotor_speed**2)
         B_tau = -Ng**2/J              # Torque input  
         B_beta = dtau_dbeta/J         # Blade pitch input 
 
@@ -300,9 +292,8 @@ class Controller():
 
 
         # separate and define below and above rated parameters
-        A_vs = A[0:len(v_below_rated)]          # below rated
-        A_pc = A[-len(v_above_rated)+1:]     # above rated
-        B_tau = B_tau * np.ones(len(v))
+        A_vs = A[:n_br]          # below rated
+        A_pc = A[n_br+1:]        # above rated
 
         # Resample omega_ and zeta_pc at above rated wind speeds
         if not list_check(self.omega_pc) and not list_check(self.zeta_pc):
@@ -320,9 +311,9 @@ class Controller():
 
         # -- Find gain schedule --
         self.pc_gain_schedule = ControllerTypes()
-        self.pc_gain_schedule.second_order_PI(self.zeta_pc_U, self.omega_pc_U,A_pc,B_beta[-len(v_above_rated)+1:],linearize=True,v=v_above_rated[1:])        
+        self.pc_gain_schedule.second_order_PI(self.zeta_pc_U, self.omega_pc_U,A_pc,B_beta[n_br+1:],linearize=True,v=v_above_rated[1:])        
         self.vs_gain_schedule = ControllerTypes()
-        self.vs_gain_schedule.second_order_PI(self.zeta_vs, self.omega_vs,A_vs,B_tau[0:len(v_below_rated)],linearize=False,v=v_below_rated)
+        self.vs_gain_schedule.second_order_PI(self.zeta_vs, self.omega_vs,A_vs,B_tau,linearize=False,v=v_below_rated)
 
         # -- Find K for Komega_g^2 --
         self.vs_rgn2K = (pi*rho*R**5.0 * turbine.Cp.max * turbine.GBoxEff/100 * turbine.GenEff/100) / \
@@ -352,14 +343,14 @@ class Controller():
         self.v_above_rated  = v_above_rated
         self.v_below_rated  = v_below_rated
         # Mod by A. Wright
-        self.v_for_gs       = v[-len(v_above_rated)+1:]
+        self.v_for_gs       = v[n_br+1:]
 		# end
         self.pitch_op       = pitch_op
-        self.pitch_op_pc    = pitch_op[-len(v_above_rated)+1:]
+        self.pitch_op_pc    = pitch_op[n_br+1:]
         self.TSR_op         = TSR_op
         self.A              = A 
         self.B_beta         = B_beta
-        self.B_tau          = B_tau
+        self.B_tau          = B_tau * np.ones(len(v))
         self.B_wind         = B_wind
         self.omega_op       = np.maximum(np.minimum(turbine.rated_rotor_speed, TSR_op*v/R), self.vs_minspd)
         self.Pi_omega       = Pi_omega
@@ -369,8 +360,13 @@ class Controller():
         # - Might want these to debug -
         self.Cp_op = Cp_op
 
+        # Cp and Ct tables at the operating TSRs, reused by the controller blocks
+        #   - rows follow self.TSR_op; anything that changes TSR_op must refresh them (see min_pitch_saturation)
+        self.Cp_grid        = Cp_grid
+        self.Ct_grid        = Ct_grid
+
         # --- Minimum pitch saturation ---
-        self.ps_min_bld_pitch = np.ones(len(self.pitch_op)) * self.min_pitch
+        self.ps_min_bld_pitch = np.full(len(self.pitch_op), self.min_pitch, dtype=float)
         self.ps = ControllerBlocks()
 
         if self.PS_Mode == 1:  # Peak Shaving
@@ -578,46 +574,42 @@ class ControllerBlocks():
 
         # Re-define Turbine Parameters for shorthand
         rho = turbine.rho             # Air density (kg/m^3)
-        R = turbine.rotor_radius      # Rotor radius (m)
-        A = np.pi*R**2                # Rotor area (m^2)
-
-        # Initialize some arrays
-        Ct_op = np.empty(len(controller.TSR_op),dtype='float64')
-        Ct_max = np.empty(len(controller.TSR_op),dtype='float64')
+        Ar = turbine.rotor_area       # Rotor area (m^2)
+        qA = 0.5 * rho * Ar * controller.v**2   # Dynamic pressure times rotor area at each wind speed (N)
 
         # Find unshaved rotor thrust coefficients at each TSR
-        for i in range(len(controller.TSR_op)):
-            Ct_op[i] = turbine.Ct.interp_surface(controller.pitch_op[i],controller.TSR_op[i])
+        Ct_op = turbine.Ct.interp_surface(controller.pitch_op,controller.TSR_op,grid=False)
 
         # Thrust vs. wind speed    
-        T = 0.5 * rho * A * controller.v**2 * Ct_op
+        T = qA * Ct_op
 
-        # Define minimum max thrust and initialize pitch_min
+        # Define minimum max thrust
         Tmax = controller.ps_percent * np.max(T)
-        pitch_min = np.ones(len(controller.pitch_op)) * controller.min_pitch
-
-        # Modify pitch_min if max thrust exceeds limits
-        for i in range(len(controller.TSR_op)):
-            # Find Ct values for operational TSR
-            Ct_tsr = turbine.Ct.interp_surface(turbine.pitch_initial_rad,controller.TSR_op[i])
-            # Define max Ct values
-            Ct_max[i] = Tmax/(0.5 * rho * A * controller.v[i]**2)
-            if T[i] > Tmax:
-                Ct_op[i] = Ct_max[i]
-            else:
-                # TSR_below_rated = np.minimum(np.max(TSR_above_rated), TSR_below_rated)
-                Ct_max[i] = np.minimum( np.max(Ct_tsr), Ct_max[i])
 
-            # Define minimum pitch angle
-            # - find min(\beta) so that Ct <= Ct_max and \beta > \beta_fine at each operational TSR
-            f_pitch_min = interpolate.interp1d(Ct_tsr, turbine.pitch_initial_rad, kind='linear', bounds_error=False, fill_value=(turbine.pitch_initial_rad[0],turbine.pitch_initial_rad[-1]))
-            pitch_min[i] = max(controller.min_pitch, f_pitch_min(Ct_max[i]))
+        # Ct values for all pitch angles at each operational TSR, [len(TSR_op) x len(pitch_initial_rad)]
+        #   - reuse the table from tune_controller when available
+        Ct_grid = getattr(controller, 'Ct_grid', None)
+        if Ct_grid is None:
+            Ct_grid = turbine.Ct.interp_surface(turbine.pitch_initial_rad,controller.TSR_op)
+
+        # Define max Ct values, limited by the Ct surface where the max thrust is not exceeded
+        Ct_max = Tmax/qA
+        shaved = T > Tmax
+        Ct_op = np.where(shaved, Ct_max, Ct_op)
+        Ct_max = np.where(shaved, Ct_max, np.minimum(np.max(Ct_grid, axis=1), Ct_max))
+
+        # Define minimum pitch angle
+        # - find min(\beta) so that Ct <= Ct_max and \beta > \beta_fine at each operational TSR
+        pitch_min = np.array([interp_unsorted(Ct_max[i], Ct_tsr, turbine.pitch_initial_rad, 
+                                              left=turbine.pitch_initial_rad[0], right=turbine.pitch_initial_rad[-1])
+                              for i, Ct_tsr in enumerate(Ct_grid)])
+        pitch_min = np.maximum(controller.min_pitch, pitch_min)
 
         # Save to controller object
         controller.ps_min_bld_pitch = pitch_min
 
         # save some outputs for analysis or future work
-        self.Tshaved = 0.5 * rho * A * controller.v**2 * Ct_op
+        self.Tshaved = np.minimum(T, Tmax)     # equal to qA * Ct_op, with Ct_op shaved to Ct_max where T > Tmax
         self.pitch_min = pitch_min
         self.v = controller.v
         self.Ct_max = Ct_max
@@ -643,22 +635,23 @@ class ControllerBlocks():
             if TSR_at_minspeed[i] > controller.TSR_op[i]:
                 controller.TSR_op[i] = TSR_at_minspeed[i]
         
-                # Initialize some arrays
-                Cp_op = np.empty(len(turbine.pitch_initial_rad),dtype='float64')
-                min_pitch = np.empty(len(TSR_at_minspeed),dtype='float64')
-        
                 # ------- Find Cp-maximizing minimum pitch schedule ---------
                 # Cp coefficients at below-rated tip speed ratios
                 Cp_op = turbine.Cp.interp_surface(turbine.pitch_initial_rad,TSR_at_minspeed[i])
 
+                # Keep the Cp and Ct tables at the operating TSRs in step with controller.TSR_op
+                if getattr(controller, 'Ct_grid', None) is not None:
+                    controller.Cp_grid[i] = Cp_op
+                    controller.Ct_grid[i] = turbine.Ct.interp_surface(turbine.pitch_initial_rad,TSR_at_minspeed[i])
+
                 # Setup and run small optimization problem to find blade pitch angle that maximizes Cp at a given TSR
                 # - Finds \beta to satisfy max( Cp(\beta,TSR_op) )
                 f_pitch_min = interpolate.interp1d(turbine.pitch_initial_rad, -Cp_op, kind='quadratic', bounds_error=False, fill_value=(turbine.pitch_initial_rad[0],turbine.pitch_initial_rad[-1]))
                 res = optimize.minimize(f_pitch_min, 0.0)
-                min_pitch[i] = res.x[0]
+                min_pitch = res.x[0]
                 
                 # modify existing minimum pitch schedule
-                controller.ps_min_bld_pitch[i] = np.maximum(controller.ps_min_bld_pitch[i], min_pitch[i])
+                controller.ps_min_bld_pitch[i] = np.maximum(controller.ps_min_bld_pitch[i], min_pitch)
 
                 # Save Cp_op
                 controller.Cp_op[i] = -res.fun
@@ -691,7 +684,7 @@ class ControllerTypes():
                Desired natural frequency with breakpoints at v
         A : array_like (1/s)
             Plant poles (state transition matrix)
-        B : array_like (varies)
+        B : float or array_like (varies)
             Plant numerators (input matrix)
         linearize : bool, optional
                     If 'True', find a gain scheduled based on a linearized plant.
@@ -700,14 +693,14 @@ class ControllerTypes():
         '''
         # Linearize system coefficients w.r.t. wind speed if desired
         if linearize:
-            pA = np.polyfit(v,A,1)
-            pB = np.polyfit(v,B,1)
-            A = pA[0]*v + pA[1]
-            B = pB[0]*v + pB[1]
+            sA, iA = linear_fit(v,A)
+            sB, iB = linear_fit(v,B)
+            A = sA*v + iA
+            B = sB*v + iB
 
-        # Calculate gain schedule
+        # Calculate gain schedule, scalar inputs are broadcast to the size of the plant
         self.Kp = 1/B * (2*zeta*om_n + A)
-        self.Ki = om_n**2/B           
+        self.Ki = om_n**2/B * np.ones_like(self.Kp)
 
 class OpenLoopControl(object):
     '''
@@ -1060,5 +1053,63 @@ def multi_sigma(xx,x_bp,y_bp):
 
     return yy
 
+def linear_fit(x,y):
+    '''
+    Least-squares fit of a line through (x, y), equivalent to np.polyfit(x,y,1)
+
+    Parameters:
+    -----------
+    x: list of floats (-)
+            sample points
+    y: list of floats (-)
+            function value at sample points
+
+    Returns:
+    --------
+    slope: float
+        slope of the fitted line
+    intercept: float
+        intercept of the fitted line
+    '''
+    x = np.asarray(x)
+    y = np.asarray(y)
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+
+    slope = np.dot(dx, y - y_mean) / np.dot(dx, dx)
+    intercept = y_mean - slope * x_mean
+
+    return slope, intercept
+
+def interp_unsorted(x,xp,fp,left=None,right=None):
+    '''
+    One-dimensional linear interpolation, like np.interp, for sample points that are not sorted, 
+        e.g., when inverting a non-monotonic curve
+
+    Parameters:
+    -----------
+    x: float or list of floats (-)
+            new sample points
+    xp: list of floats (-)
+            sample points, in any order
+    fp : list of floats (-)
+            function value at sample points
+    left: float, optional
+            value returned for x < min(xp), default is the fp value at min(xp)
+    right: float, optional
+            value returned for x > max(xp), default is the fp value at max(xp)
+
+    Returns:
+    --------
+    y: float or List-like
+        interpolated values corresponding to x
+    '''
+    xp = np.asarray(xp)
+    fp = np.asarray(fp)
+    i_sort = np.argsort(xp, kind='mergesort')
+
+    return np.interp(x, xp[i_sort], fp[i_sort], left=left, right=right)
+
 def all_same(items):
     return all(x == items[0] for x in items)
@@ -12,6 +12,7 @@
 import os
 import numpy as np
 import datetime
+from functools import cached_property
 from scipy import interpolate
 from numpy import gradient
 import pickle
@@ -104,6 +105,13 @@ class Turbine():
         print('------------------------------------------')
         return ' '
 
+    @property
+    def rotor_area(self):
+        '''
+        Rotor swept area (m^2), computed from rotor_radius
+        '''
+        return pi * self.rotor_radius**2
+
     # Save function
     def save(self,filename):
         '''
@@ -657,46 +665,68 @@ class RotorPerformance():
         performance_max_ind = np.where(performance_fine == np.max(performance_fine)) # Find max performance at fine pitch
         self.TSR_opt = float(TSR_fine[performance_max_ind[0]][0])  # TSR to maximize Cx at fine pitch
 
-    def interp_surface(self,pitch,TSR):
+    # Interpolant functions which can look up any arbitrary location on rotor performance surface, and its gradient.
+    # These are fit on first use so that RotorPerformance objects pickled without them still load.
+    @cached_property
+    def surface_interp(self):
+        return interpolate.RectBivariateSpline(self.pitch_initial_rad, self.TSR_initial, self.performance_table.T)
+
+    @cached_property
+    def gradient_pitch_interp(self):
+        return interpolate.RectBivariateSpline(self.pitch_initial_rad, self.TSR_initial, self.gradient_pitch.T)
+
+    @cached_property
+    def gradient_TSR_interp(self):
+        return interpolate.RectBivariateSpline(self.pitch_initial_rad, self.TSR_initial, self.gradient_TSR.T)
+
+    def interp_surface(self,pitch,TSR,grid=True):
         '''
         2d interpolation to find point on rotor performance surface
         
         Parameters:
         -----------
-        pitch : float (rad)
-                Pitch angle to look up
-        TSR : float (rad)
-              Tip-speed ratio to look up
+        pitch : float or array_like (rad)
+                Pitch angle(s) to look up
+        TSR : float or array_like (rad)
+              Tip-speed ratio(s) to look up, need not be sorted
+        grid : bool, optional
+               If 'True', look up every combination of pitch and TSR. 
+               If 'False', look up the points (pitch[i], TSR[i]) element-wise.
+
+        Returns:
+        --------
+        interp_surface : array_like
+                         [len(TSR) x len(pitch)] array of rotor performance values, with singleton dimensions removed. 
+                         If grid is 'False', an array of the same shape as pitch and TSR.
         '''
-        
-        # Form the interpolant functions which can look up any arbitrary location on rotor performance surface
-        interp_fun = interpolate.RectBivariateSpline(
-            self.pitch_initial_rad, self.TSR_initial, self.performance_table.T)
-        return np.squeeze(interp_fun(pitch,TSR).T)
+        if not grid:
+            return self.surface_interp(pitch,TSR,grid=False)
+
+        # The spline is evaluated on a sorted grid, so look up the unique values and map back to the inputs
+        pitch_unique, pitch_ind = np.unique(pitch, return_inverse=True)
+        TSR_unique, TSR_ind = np.unique(TSR, return_inverse=True)
+        surface = self.surface_interp(pitch_unique,TSR_unique)[np.ravel(pitch_ind)][:,np.ravel(TSR_ind)]
+        return np.squeeze(surface.T)
 
     def interp_gradient(self,pitch,TSR):
         '''
-        2d interpolation to find gradient at a specified point on rotor performance surface
+        2d interpolation to find gradient at specified point(s) on rotor performance surface
         
         Parameters:
         -----------
-        pitch : float (rad)
-                Pitch angle to look up
-        TSR : float (rad)
-              Tip-speed ratio to look up
+        pitch : float or array_like (rad)
+                Pitch angle(s) to look up
+        TSR : float or array_like (rad)
+              Tip-speed ratio(s) to look up, paired element-wise with pitch
 
         Returns:
         --------
         interp_gradient : array_like
-                          [1 x 2] array coresponding to gradient in pitch and TSR directions, respectively
+                          [2 x 1] or [2 x n] array coresponding to gradient in pitch and TSR directions, respectively
         '''
-        # Form the interpolant functions to find gradient at any arbitrary location on rotor performance surface
-        dCP_beta_interp = interpolate.RectBivariateSpline(self.pitch_initial_rad, self.TSR_initial, self.gradient_pitch.T)
-        dCP_TSR_interp = interpolate.RectBivariateSpline(self.pitch_initial_rad, self.TSR_initial, self.gradient_TSR.T)
-
-        # grad.shape output as (2,) numpy array, equivalent to (pitch-direction,TSR-direction)
-        grad = np.array([dCP_beta_interp(pitch,TSR).T, dCP_TSR_interp(pitch,TSR).T])
-        return np.ndarray.flatten(grad)
+        # grad.shape output as (2,) or (2,n) numpy array, equivalent to (pitch-direction,TSR-direction)
+        grad = np.array([self.gradient_pitch_interp(pitch,TSR,grid=False), self.gradient_TSR_interp(pitch,TSR,grid=False)])
+        return grad
     
     def plot_performance(self):
         '''
@@ -23,6 +23,7 @@ DISCON_dict
 list_check
 """
 import datetime
+import io
 import os
 import numpy as np
 import subprocess
@@ -81,214 +82,217 @@ def write_DISCON(turbine, controller, param_file='DISCON.IN', txt_filename='Cp_C
     if not hasattr(rosco_vt['StC_GroupIndex'],'__len__'):
         rosco_vt['StC_GroupIndex'] = [rosco_vt['StC_GroupIndex']]   
 
-    print('Writing new controller parameter file parameter file: %s.' % param_file)
+    print(f'Writing new controller parameter file parameter file: {param_file}.')
     # Should be obvious what's going on here...
-    file = open(param_file,'w')
-    file.write('! Controller parameter input file for the %s wind turbine\n' % turbine.TurbineName)
-    file.write('!    - File written using ROSCO version {} controller tuning logic on {}\n'.format(rosco.toolbox.__version__, now.strftime('%m/%d/%y')))
+    # - the file contents are collected in memory and written out at once
+    file = io.StringIO()
+    file.write(f'! Controller parameter input file for the {turbine.TurbineName} wind turbine\n')
+    file.write(f'!    - File written using ROSCO version {rosco.toolbox.__version__} controller tuning logic on {now.strftime("%m/%d/%y")}\n')
     file.write('\n')
     file.write('!------- SIMULATION CONTROL ------------------------------------------------------------\n')
-    file.write('{0:<12d}        ! LoggingLevel		- {{0: write no debug files, 1: write standard output .dbg-file, 2: LoggingLevel 1 + ROSCO LocalVars (.dbg2) 3: LoggingLevel 2 + complete avrSWAP-array (.dbg3)}}\n'.format(int(rosco_vt['LoggingLevel'])))
-    file.write('{}                   ! DT_Out    		  - {{Time step to output .dbg* files, or 0 to match sampling period of OpenFAST}}\n'.format(rosco_vt['DT_Out']))
-    file.write('{:<11d}         ! Ext_Interface		- ({})\n'.format(int(rosco_vt['Ext_Interface']), input_descriptions['Ext_Interface']))
-    file.write('{:<11d}         ! Echo		        - ({})\n'.format(int(rosco_vt['Echo']), input_descriptions['Echo']))
+    file.write(f'{int(rosco_vt["LoggingLevel"]):<12d}        ! LoggingLevel		- {{0: write no debug files, 1: write standard output .dbg-file, 2: LoggingLevel 1 + ROSCO LocalVars (.dbg2) 3: LoggingLevel 2 + complete avrSWAP-array (.dbg3)}}\n')
+    file.write(f'{rosco_vt["DT_Out"]}                   ! DT_Out    		  - {{Time step to output .dbg* files, or 0 to match sampling period of OpenFAST}}\n')
+    file.write(f'{int(rosco_vt["Ext_Interface"]):<11d}         ! Ext_Interface		- ({input_descriptions["Ext_Interface"]})\n')
+    file.write(f'{int(rosco_vt["Echo"]):<11d}         ! Echo		        - ({input_descriptions["Echo"]})\n')
     file.write('\n')
     file.write('!------- CONTROLLER FLAGS -------------------------------------------------\n')
-    file.write('{0:<12d}        ! F_LPFType			  - (1: first-order low-pass filter, 2: second-order low-pass filter), [rad/s] (currently filters generator speed and pitch control signals\n'.format(int(rosco_vt['F_LPFType'])))
-    file.write('{0:<12d}        ! IPC_ControlMode	- Turn Individual Pitch Control (IPC) for fatigue load reductions (pitch contribution) {{0: off, 1: 1P reductions, 2: 1P+2P reductions}}\n'.format(int(rosco_vt['IPC_ControlMode'])))
-    file.write('{0:<12d}        ! VS_ControlMode	- Generator torque control mode in above rated conditions (0- no torque control, 1- k*omega^2 with PI transitions, 2- WSE TSR Tracking, 3- Power-based TSR Tracking)}}\n'.format(int(rosco_vt['VS_ControlMode'])))
-    file.write('{0:<12d}        ! VS_ConstPower  	- Do constant power torque control, where above rated torque varies, 0 for constant torque}}\n'.format(int(rosco_vt['VS_ConstPower'])))
-    file.write('{0:<12d}        ! PC_ControlMode  - Blade pitch control mode {{0: No pitch, fix to fine pitch, 1: active PI blade pitch control}}\n'.format(int(rosco_vt['PC_ControlMode'])))
-    file.write('{0:<12d}        ! Y_ControlMode   - Yaw control mode {{0: no yaw control, 1: yaw rate control, 2: yaw-by-IPC}}\n'.format(int(rosco_vt['Y_ControlMode'])))
-    file.write('{0:<12d}        ! SS_Mode         - Setpoint Smoother mode {{0: no setpoint smoothing, 1: introduce setpoint smoothing}}\n'.format(int(rosco_vt['SS_Mode'])))
-    file.write('{0:<12d}        ! PRC_Mode        - Power reference tracking mode{{0: use standard rotor speed set points, 1: use PRC rotor speed setpoints}}\n'.format(int(rosco_vt['PRC_Mode'])))
-    file.write('{0:<12d}        ! WE_Mode         - Wind speed estimator mode {{0: One-second low pass filtered hub height wind speed, 1: Immersion and Invariance Estimator, 2: Extended Kalman Filter}}\n'.format(int(rosco_vt['WE_Mode'])))
-    file.write('{0:<12d}        ! PS_Mode         - Pitch saturation mode {{0: no pitch saturation, 1: implement pitch saturation}}\n'.format(int(rosco_vt['PS_Mode'])))
-    file.write('{0:<12d}        ! SD_Mode         - Shutdown mode {{0: no shutdown procedure, 1: pitch to max pitch at shutdown}}\n'.format(int(rosco_vt['SD_Mode'])))
-    file.write('{0:<12d}        ! Fl_Mode         - Floating specific feedback mode {{0: no nacelle velocity feedback, 1: feed back translational velocity, 2: feed back rotational veloicty}}\n'.format(int(rosco_vt['Fl_Mode'])))
-    file.write('{:<12d}        ! TD_Mode         - {}\n'.format(int(rosco_vt['TD_Mode']),mode_descriptions['TD_Mode']))
-    file.write('{:<12d}        ! TRA_Mode        - {}\n'.format(int(rosco_vt['TRA_Mode']),mode_descriptions['TRA_Mode']))
-    file.write('{0:<12d}        ! Flp_Mode        - Flap control mode {{0: no flap control, 1: steady state flap angle, 2: Proportional flap control, 2: Cyclic (1P) flap control}}\n'.format(int(rosco_vt['Flp_Mode'])))
-    file.write('{0:<12d}        ! OL_Mode         - Open loop control mode {{0: no open loop control, 1: open loop control vs. time, 2: rotor position control}}\n'.format(int(rosco_vt['OL_Mode'])))
-    file.write('{0:<12d}        ! PA_Mode         - Pitch actuator mode {{0 - not used, 1 - first order filter, 2 - second order filter}}\n'.format(int(rosco_vt['PA_Mode'])))
-    file.write('{0:<12d}        ! PF_Mode         - Pitch fault mode {{0 - not used, 1 - constant offset on one or more blades}}\n'.format(int(rosco_vt['PF_Mode'])))
-    file.write('{0:<12d}        ! AWC_Mode        - Active wake control {{0 - not used, 1 - complex number method, 2 - Coleman transform method}}\n'.format(int(rosco_vt['AWC_Mode'])))
-    file.write('{0:<12d}        ! Ext_Mode        - External control mode {{0 - not used, 1 - call external dynamic library}}\n'.format(int(rosco_vt['Ext_Mode'])))
-    file.write('{0:<12d}        ! ZMQ_Mode        - Fuse ZeroMQ interface {{0: unused, 1: Yaw Control}}\n'.format(int(rosco_vt['ZMQ_Mode'])))
-    file.write('{:<12d}        ! CC_Mode         - {}\n'.format(int(rosco_vt['CC_Mode']),mode_descriptions['CC_Mode']))
-    file.write('{:<12d}        ! StC_Mode        - {}\n'.format(int(rosco_vt['StC_Mode']),mode_descriptions['StC_Mode']))
+    file.write(f'{int(rosco_vt["F_LPFType"]):<12d}        ! F_LPFType			  - (1: first-order low-pass filter, 2: second-order low-pass filter), [rad/s] (currently filters generator speed and pitch control signals\n')
+    file.write(f'{int(rosco_vt["IPC_ControlMode"]):<12d}        ! IPC_ControlMode	- Turn Individual Pitch Control (IPC) for fatigue load reductions (pitch contribution) {{0: off, 1: 1P reductions, 2: 1P+2P reductions}}\n')
+    file.write(f'{int(rosco_vt["VS_ControlMode"]):<12d}        ! VS_ControlMode	- Generator torque control mode in above rated conditions (0- no torque control, 1- k*omega^2 with PI transitions, 2- WSE TSR Tracking, 3- Power-based TSR Tracking)}}\n')
+    file.write(f'{int(rosco_vt["VS_ConstPower"]):<12d}        ! VS_ConstPower  	- Do constant power torque control, where above rated torque varies, 0 for constant torque}}\n')
+    file.write(f'{int(rosco_vt["PC_ControlMode"]):<12d}        ! PC_ControlMode  - Blade pitch control mode {{0: No pitch, fix to fine pitch, 1: active PI blade pitch control}}\n')
+    file.write(f'{int(rosco_vt["Y_ControlMode"]):<12d}        ! Y_ControlMode   - Yaw control mode {{0: no yaw control, 1: yaw rate control, 2: yaw-by-IPC}}\n')
+    file.write(f'{int(rosco_vt["SS_Mode"]):<12d}        ! SS_Mode         - Setpoint Smoother mode {{0: no setpoint smoothing, 1: introduce setpoint smoothing}}\n')
+    file.write(f'{int(rosco_vt["PRC_Mode"]):<12d}        ! PRC_Mode        - Power reference tracking mode{{0: use standard rotor speed set points, 1: use PRC rotor speed setpoints}}\n')
+    file.write(f'{int(rosco_vt["WE_Mode"]):<12d}        ! WE_Mode         - Wind speed estimator mode {{0: One-second low pass filtered hub height wind speed, 1: Immersion and Invariance Estimator, 2: Extended Kalman Filter}}\n')
+    file.write(f'{int(rosco_vt["PS_Mode"]):<12d}        ! PS_Mode         - Pitch saturation mode {{0: no pitch saturation, 1: implement pitch saturation}}\n')
+    file.write(f'{int(rosco_vt["SD_Mode"]):<12d}        ! SD_Mode         - Shutdown mode {{0: no shutdown procedure, 1: pitch to max pitch at shutdown}}\n')
+    file.write(f'{int(rosco_vt["Fl_Mode"]):<12d}        ! Fl_Mode         - Floating specific feedback mode {{0: no nacelle velocity feedback, 1: feed back translational velocity, 2: feed back rotational veloicty}}\n')
+    file.write(f'{int(rosco_vt["TD_Mode"]):<12d}        ! TD_Mode         - {mode_descriptions["TD_Mode"]}\n')
+    file.write(f'{int(rosco_vt["TRA_Mode"]):<12d}        ! TRA_Mode        - {mode_descriptions["TRA_Mode"]}\n')
+    file.write(f'{int(rosco_vt["Flp_Mode"]):<12d}        ! Flp_Mode        - Flap control mode {{0: no flap control, 1: steady state flap angle, 2: Proportional flap control, 2: Cyclic (1P) flap control}}\n')
+    file.write(f'{int(rosco_vt["OL_Mode"]):<12d}        ! OL_Mode         - Open loop control mode {{0: no open loop control, 1: open loop control vs. time, 2: rotor position control}}\n')
+    file.write(f'{int(rosco_vt["PA_Mode"]):<12d}        ! PA_Mode         - Pitch actuator mode {{0 - not used, 1 - first order filter, 2 - second order filter}}\n')
+    file.write(f'{int(rosco_vt["PF_Mode"]):<12d}        ! PF_Mode         - Pitch fault mode {{0 - not used, 1 - constant offset on one or more blades}}\n')
+    file.write(f'{int(rosco_vt["AWC_Mode"]):<12d}        ! AWC_Mode        - Active wake control {{0 - not used, 1 - complex number method, 2 - Coleman transform method}}\n')
+    file.write(f'{int(rosco_vt["Ext_Mode"]):<12d}        ! Ext_Mode        - External control mode {{0 - not used, 1 - call external dynamic library}}\n')
+    file.write(f'{int(rosco_vt["ZMQ_Mode"]):<12d}        ! ZMQ_Mode        - Fuse ZeroMQ interface {{0: unused, 1: Yaw Control}}\n')
+    file.write(f'{int(rosco_vt["CC_Mode"]):<12d}        ! CC_Mode         - {mode_descriptions["CC_Mode"]}\n')
+    file.write(f'{int(rosco_vt["StC_Mode"]):<12d}        ! StC_Mode        - {mode_descriptions["StC_Mode"]}\n')
 
     file.write('\n')
     file.write('!------- FILTERS ----------------------------------------------------------\n') 
-    file.write('{:<13.5f}       ! F_LPFCornerFreq	  - Corner frequency (-3dB point) in the low-pass filters, [rad/s]\n'.format(rosco_vt['F_LPFCornerFreq'])) 
-    file.write('{:<13.5f}       ! F_LPFDamping		  - Damping coefficient {{used only when F_FilterType = 2}} [-]\n'.format(rosco_vt['F_LPFDamping']))
-    file.write('{:<12d}        ! F_NumNotchFilts   - {}\n'.format(int(rosco_vt["F_NumNotchFilts"]), input_descriptions["F_NumNotchFilts"]))
-    file.write('{}        ! F_NotchFreqs      - {}\n'.format(write_array(rosco_vt["F_NotchFreqs"]), input_descriptions["F_NotchFreqs"]))
-    file.write('{}        ! F_NotchBetaNum    - {}\n'.format(write_array(rosco_vt['F_NotchBetaNum']), input_descriptions["F_NotchBetaNum"]))
-    file.write('{}        ! F_NotchBetaDen    - {}\n'.format(write_array(rosco_vt['F_NotchBetaDen']), input_descriptions["F_NotchBetaDen"]))
-    file.write('{:<12d}        ! F_GenSpdNotch_N   - {}\n'.format(int(rosco_vt['F_GenSpdNotch_N']), input_descriptions["F_GenSpdNotch_N"]))
-    file.write('{}        ! F_GenSpdNotch_Ind - {}\n'.format(write_array(rosco_vt['F_GenSpdNotch_Ind'],'d'), input_descriptions["F_GenSpdNotch_Ind"]))
-    file.write('{:<12d}        ! F_TwrTopNotch_N   - {}\n'.format(int(rosco_vt['F_TwrTopNotch_N']), input_descriptions["F_TwrTopNotch_N"]))
-    file.write('{}        ! F_TwrTopNotch_Ind - {}\n'.format(write_array(rosco_vt['F_TwrTopNotch_Ind'],'d'), input_descriptions["F_TwrTopNotch_Ind"]))
-    file.write('{:<13.5f}       ! F_SSCornerFreq    - Corner frequency (-3dB point) in the first order low pass filter for the setpoint smoother, [rad/s].\n'.format(rosco_vt['F_SSCornerFreq']))
-    file.write('{:<13.5f}       ! F_WECornerFreq    - Corner frequency (-3dB point) in the first order low pass filter for the wind speed estimate [rad/s].\n'.format(rosco_vt['F_WECornerFreq']))
-    file.write('{:<13.5f}       ! F_YawErr          - Low pass filter corner frequency for yaw controller [rad/s].\n'.format(rosco_vt['F_YawErr']))
-    file.write('{}! F_FlCornerFreq    - Natural frequency and damping in the second order low pass filter of the tower-top fore-aft motion for floating feedback control [rad/s, -].\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['F_FlCornerFreq'][i]) for i in range(len(rosco_vt['F_FlCornerFreq'])))))
-    file.write('{:<13.5f}       ! F_FlHighPassFreq  - Natural frequency of first-order high-pass filter for nacelle fore-aft motion [rad/s].\n'.format(rosco_vt['F_FlHighPassFreq']))
-    file.write('{}     ! F_FlpCornerFreq   - {}\n'.format(write_array(rosco_vt["F_FlpCornerFreq"]), input_descriptions["F_FlpCornerFreq"]))
+    file.write(f'{rosco_vt["F_LPFCornerFreq"]:<13.5f}       ! F_LPFCornerFreq	  - Corner frequency (-3dB point) in the low-pass filters, [rad/s]\n') 
+    file.write(f'{rosco_vt["F_LPFDamping"]:<13.5f}       ! F_LPFDamping		  - Damping coefficient {{used only when F_FilterType = 2}} [-]\n')
+    file.write(f'{int(rosco_vt["F_NumNotchFilts"]):<12d}        ! F_NumNotchFilts   - {input_descriptions["F_NumNotchFilts"]}\n')
+    file.write(f'{write_array(rosco_vt["F_NotchFreqs"])}        ! F_NotchFreqs      - {input_descriptions["F_NotchFreqs"]}\n')
+    file.write(f'{write_array(rosco_vt["F_NotchBetaNum"])}        ! F_NotchBetaNum    - {input_descriptions["F_NotchBetaNum"]}\n')
+    file.write(f'{write_array(rosco_vt["F_NotchBetaDen"])}        ! F_NotchBetaDen    - {input_descriptions["F_NotchBetaDen"]}\n')
+    file.write(f'{int(rosco_vt["F_GenSpdNotch_N"]):<12d}        ! F_GenSpdNotch_N   - {input_descriptions["F_GenSpdNotch_N"]}\n')
+    file.write(f'{write_array(rosco_vt["F_GenSpdNotch_Ind"],"d")}        ! F_GenSpdNotch_Ind - {input_descriptions["F_GenSpdNotch_Ind"]}\n')
+    file.write(f'{int(rosco_vt["F_TwrTopNotch_N"]):<12d}        ! F_TwrTopNotch_N   - {input_descriptions["F_TwrTopNotch_N"]}\n')
+    file.write(f'{write_array(rosco_vt["F_TwrTopNotch_Ind"],"d")}        ! F_TwrTopNotch_Ind - {input_descriptions["F_TwrTopNotch_Ind"]}\n')
+    file.write(f'{rosco_vt["F_SSCornerFreq"]:<13.5f}       ! F_SSCornerFreq    - Corner frequency (-3dB point) in the first order low pass filter for the setpoint smoother, [rad/s].\n')
+    file.write(f'{rosco_vt["F_WECornerFreq"]:<13.5f}       ! F_WECornerFreq    - Corner frequency (-3dB point) in the first order low pass filter for the wind speed estimate [rad/s].\n')
+    file.write(f'{rosco_vt["F_YawErr"]:<13.5f}       ! F_YawErr          - Low pass filter corner frequency for yaw controller [rad/s].\n')
+    file.write(f'{write_array(rosco_vt["F_FlCornerFreq"],"<4.6f",sep="  ",line_width=0)}! F_FlCornerFreq    - Natural frequency and damping in the second order low pass filter of the tower-top fore-aft motion for floating feedback control [rad/s, -].\n')
+    file.write(f'{rosco_vt["F_FlHighPassFreq"]:<13.5f}       ! F_FlHighPassFreq  - Natural frequency of first-order high-pass filter for nacelle fore-aft motion [rad/s].\n')
+    file.write(f'{write_array(rosco_vt["F_FlpCornerFreq"])}     ! F_FlpCornerFreq   - {input_descriptions["F_FlpCornerFreq"]}\n')
     
     file.write('\n')
     file.write('!------- BLADE PITCH CONTROL ----------------------------------------------\n')
-    file.write('{:<11d}         ! PC_GS_n			- Amount of gain-scheduling table entries\n'.format(int(rosco_vt['PC_GS_n'])))
-    file.write('{}              ! PC_GS_angles	    - Gain-schedule table: pitch angles [rad].\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['PC_GS_angles'][i]) for i in range(len(rosco_vt['PC_GS_angles'])))))            
-    file.write('{}              ! PC_GS_KP		- Gain-schedule table: pitch controller kp gains [s].\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['PC_GS_KP'][i]) for i in range(len(rosco_vt['PC_GS_KP'])))))
-    file.write('{}              ! PC_GS_KI		- Gain-schedule table: pitch controller ki gains [-].\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['PC_GS_KI'][i]) for i in range(len(rosco_vt['PC_GS_KI'])))))#	
-    file.write('{}              ! PC_GS_KD			- Gain-schedule table: pitch controller kd gains\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['PC_GS_KD'][i]) for i in range(len(rosco_vt['PC_GS_KD'])))))
-    file.write('{}              ! PC_GS_TF			- Gain-schedule table: pitch controller tf gains (derivative filter)\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['PC_GS_TF'][i]) for i in range(len(rosco_vt['PC_GS_TF'])))))
-    file.write('{:<014.5f}      ! PC_MaxPit			- Maximum physical pitch limit, [rad].\n'.format(rosco_vt['PC_MaxPit']))
-    file.write('{:<014.5f}      ! PC_MinPit			- Minimum physical pitch limit, [rad].\n'.format(rosco_vt['PC_MinPit']))
-    file.write('{:<014.5f}      ! PC_MaxRat			- Maximum pitch rate (in absolute value) in pitch controller, [rad/s].\n'.format(rosco_vt['PC_MaxRat']))
-    file.write('{:<014.5f}      ! PC_MinRat			- Minimum pitch rate (in absolute value) in pitch controller, [rad/s].\n'.format(rosco_vt['PC_MinRat']))
-    file.write('{:<014.5f}      ! PC_RefSpd			- Desired (reference) HSS speed for pitch controller, [rad/s].\n'.format(rosco_vt['PC_RefSpd']))
-    file.write('{:<014.5f}      ! PC_FinePit		- Record 5: Below-rated pitch angle set-point, [rad]\n'.format(rosco_vt['PC_FinePit']))
-    file.write('{:<014.5f}      ! PC_Switch			- Angle above lowest minimum pitch angle for switch, [rad]\n'.format(rosco_vt['PC_Switch']))
+    file.write(f'{int(rosco_vt["PC_GS_n"]):<11d}         ! PC_GS_n			- Amount of gain-scheduling table entries\n')
+    file.write(f'{write_array(rosco_vt["PC_GS_angles"],"<4.6f",sep="  ",line_width=0)}              ! PC_GS_angles	    - Gain-schedule table: pitch angles [rad].\n')            
+    file.write(f'{write_array(rosco_vt["PC_GS_KP"],"<4.6f",sep="  ",line_width=0)}              ! PC_GS_KP		- Gain-schedule table: pitch controller kp gains [s].\n')
+    file.write(f'{write_array(rosco_vt["PC_GS_KI"],"<4.6f",sep="  ",line_width=0)}              ! PC_GS_KI		- Gain-schedule table: pitch controller ki gains [-].\n')#	
+    file.write(f'{write_array(rosco_vt["PC_GS_KD"],"<4.6f",sep="  ",line_width=0)}              ! PC_GS_KD			- Gain-schedule table: pitch controller kd gains\n')
+    file.write(f'{write_array(rosco_vt["PC_GS_TF"],"<4.6f",sep="  ",line_width=0)}              ! PC_GS_TF			- Gain-schedule table: pitch controller tf gains (derivative filter)\n')
+    file.write(f'{rosco_vt["PC_MaxPit"]:<014.5f}      ! PC_MaxPit			- Maximum physical pitch limit, [rad].\n')
+    file.write(f'{rosco_vt["PC_MinPit"]:<014.5f}      ! PC_MinPit			- Minimum physical pitch limit, [rad].\n')
+    file.write(f'{rosco_vt["PC_MaxRat"]:<014.5f}      ! PC_MaxRat			- Maximum pitch rate (in absolute value) in pitch controller, [rad/s].\n')
+    file.write(f'{rosco_vt["PC_MinRat"]:<014.5f}      ! PC_MinRat			- Minimum pitch rate (in absolute value) in pitch controller, [rad/s].\n')
+    file.write(f'{rosco_vt["PC_RefSpd"]:<014.5f}      ! PC_RefSpd			- Desired (reference) HSS speed for pitch controller, [rad/s].\n')
+    file.write(f'{rosco_vt["PC_FinePit"]:<014.5f}      ! PC_FinePit		- Record 5: Below-rated pitch angle set-point, [rad]\n')
+    file.write(f'{rosco_vt["PC_Switch"]:<014.5f}      ! PC_Switch			- Angle above lowest minimum pitch angle for switch, [rad]\n')
     file.write('\n')
     file.write('!------- INDIVIDUAL PITCH CONTROL -----------------------------------------\n')
-    file.write('{}! IPC_Vramp		- Start and end wind speeds for cut-in ramp function. First entry: IPC inactive, second entry: IPC fully active. [m/s]\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['IPC_Vramp'][i]) for i in range(len(rosco_vt['IPC_Vramp'])))))
-    file.write('{:<11d}         ! IPC_SatMode		- IPC Saturation method (0 - no saturation (except by PC_MinPit), 1 - saturate by PS_BldPitchMin, 2 - saturate sotfly (full IPC cycle) by PC_MinPit, 3 - saturate softly by PS_BldPitchMin)\n'.format(int(rosco_vt['IPC_SatMode']))) # Hardcode to 5 degrees
-    file.write('{:<13.1f}       ! IPC_IntSat		- Integrator saturation (maximum signal amplitude contribution to pitch from IPC), [rad]\n'.format(rosco_vt['IPC_IntSat'])) 
-    file.write('{}! IPC_KP			- Proportional gain for the individual pitch controller: first parameter for 1P reductions, second for 2P reductions, [-]\n'.format(''.join('{:<4.3e} '.format(rosco_vt['IPC_KP'][i]) for i in range(len(rosco_vt['IPC_KP'])))))
-    file.write('{}! IPC_KI			- Integral gain for the individual pitch controller: first parameter for 1P reductions, second for 2P reductions, [-]\n'.format(''.join('{:<4.3e} '.format(rosco_vt['IPC_KI'][i]) for i in range(len(rosco_vt['IPC_KI'])))))
-    file.write('{}! IPC_aziOffset		- Phase offset added to the azimuth angle for the individual pitch controller, [rad]. \n'.format(''.join('{:<4.6f}  '.format(rosco_vt['IPC_aziOffset'][i]) for i in range(len(rosco_vt['IPC_aziOffset'])))))
-    file.write('{:<13.1f}       ! IPC_CornerFreqAct - Corner frequency of the first-order actuators model, to induce a phase lag in the IPC signal {{0: Disable}}, [rad/s]\n'.format(rosco_vt['IPC_CornerFreqAct']))
+    file.write(f'{write_array(rosco_vt["IPC_Vramp"],"<4.6f",sep="  ",line_width=0)}! IPC_Vramp		- Start and end wind speeds for cut-in ramp function. First entry: IPC inactive, second entry: IPC fully active. [m/s]\n')
+    file.write(f'{int(rosco_vt["IPC_SatMode"]):<11d}         ! IPC_SatMode		- IPC Saturation method (0 - no saturation (except by PC_MinPit), 1 - saturate by PS_BldPitchMin, 2 - saturate sotfly (full IPC cycle) by PC_MinPit, 3 - saturate softly by PS_BldPitchMin)\n') # Hardcode to 5 degrees
+    file.write(f'{rosco_vt["IPC_IntSat"]:<13.1f}       ! IPC_IntSat		- Integrator saturation (maximum signal amplitude contribution to pitch from IPC), [rad]\n') 
+    file.write(f'{write_array(rosco_vt["IPC_KP"],"<4.3e",line_width=0)}! IPC_KP			- Proportional gain for the individual pitch controller: first parameter for 1P reductions, second for 2P reductions, [-]\n')
+    file.write(f'{write_array(rosco_vt["IPC_KI"],"<4.3e",line_width=0)}! IPC_KI			- Integral gain for the individual pitch controller: first parameter for 1P reductions, second for 2P reductions, [-]\n')
+    file.write(f'{write_array(rosco_vt["IPC_aziOffset"],"<4.6f",sep="  ",line_width=0)}! IPC_aziOffset		- Phase offset added to the azimuth angle for the individual pitch controller, [rad]. \n')
+    file.write(f'{rosco_vt["IPC_CornerFreqAct"]:<13.1f}       ! IPC_CornerFreqAct - Corner frequency of the first-order actuators model, to induce a phase lag in the IPC signal {{0: Disable}}, [rad/s]\n')
     file.write('\n')
     file.write('!------- VS TORQUE CONTROL ------------------------------------------------\n')
-    file.write('{:<014.5f}      ! VS_GenEff			- Generator efficiency mechanical power -> electrical power, [should match the efficiency defined in the generator properties!], [%]\n'.format(rosco_vt['VS_GenEff']))
-    file.write('{:<014.5f}      ! VS_ArSatTq		- Above rated generator torque PI control saturation, [Nm]\n'.format(rosco_vt['VS_ArSatTq']))
-    file.write('{:<014.5f}      ! VS_MaxRat			- Maximum torque rate (in absolute value) in torque controller, [Nm/s].\n'.format(rosco_vt['VS_MaxRat']))
-    file.write('{:<014.5f}      ! VS_MaxTq			- Maximum generator torque in Region 3 (HSS side), [Nm].\n'.format(rosco_vt['VS_MaxTq']))
-    file.write('{:<014.5f}      ! VS_MinTq			- Minimum generator torque (HSS side), [Nm].\n'.format(rosco_vt['VS_MinTq']))
-    file.write('{:<014.5f}      ! VS_MinOMSpd		- Minimum generator speed [rad/s]\n'.format(rosco_vt['VS_MinOMSpd']))
-    file.write('{:<014.5f}      ! VS_Rgn2K		- {}\n'.format(float(rosco_vt['VS_Rgn2K']),input_descriptions['VS_Rgn2K']))
-    file.write('{:<014.5f}      ! VS_RtPwr			- Wind turbine rated power [W]\n'.format(rosco_vt['VS_RtPwr']))
-    file.write('{:<014.5f}      ! VS_RtTq			- Rated torque, [Nm].\n'.format(rosco_vt['VS_RtTq']))
-    file.write('{:<014.5f}      ! VS_RefSpd			- Rated generator speed [rad/s]\n'.format(rosco_vt['VS_RefSpd']))
-    file.write('{:<11d}         ! VS_n				- Number of generator PI torque controller gains\n'.format(int(rosco_vt['VS_n'])))
-    file.write('{:<014.5f}      ! VS_KP				- Proportional gain for generator PI torque controller [-]. (Only used in the transitional 2.5 region if VS_ControlMode =/ 2)\n'.format(rosco_vt['VS_KP']))
-    file.write('{:<014.5f}      ! VS_KI				- Integral gain for generator PI torque controller [s]. (Only used in the transitional 2.5 region if VS_ControlMode =/ 2)\n'.format(rosco_vt['VS_KI']))
-    file.write('{:<13.2f}       ! VS_TSRopt		    - {}\n'.format(float(rosco_vt['VS_TSRopt']),input_descriptions['VS_TSRopt']))
-    file.write('{:<014.5f}      ! VS_PwrFiltF		- {}\n'.format(float(rosco_vt['VS_PwrFiltF']),input_descriptions['VS_PwrFiltF']))
+    file.write(f'{rosco_vt["VS_GenEff"]:<014.5f}      ! VS_GenEff			- Generator efficiency mechanical power -> electrical power, [should match the efficiency defined in the generator properties!], [%]\n')
+    file.write(f'{rosco_vt["VS_ArSatTq"]:<014.5f}      ! VS_ArSatTq		- Above rated generator torque PI control saturation, [Nm]\n')
+    file.write(f'{rosco_vt["VS_MaxRat"]:<014.5f}      ! VS_MaxRat			- Maximum torque rate (in absolute value) in torque controller, [Nm/s].\n')
+    file.write(f'{rosco_vt["VS_MaxTq"]:<014.5f}      ! VS_MaxTq			- Maximum generator torque in Region 3 (HSS side), [Nm].\n')
+    file.write(f'{rosco_vt["VS_MinTq"]:<014.5f}      ! VS_MinTq			- Minimum generator torque (HSS side), [Nm].\n')
+    file.write(f'{rosco_vt["VS_MinOMSpd"]:<014.5f}      ! VS_MinOMSpd		- Minimum generator speed [rad/s]\n')
+    file.write(f'{float(rosco_vt["VS_Rgn2K"]):<014.5f}      ! VS_Rgn2K		- {input_descriptions["VS_Rgn2K"]}\n')
+    file.write(f'{rosco_vt["VS_RtPwr"]:<014.5f}      ! VS_RtPwr			- Wind turbine rated power [W]\n')
+    file.write(f'{rosco_vt["VS_RtTq"]:<014.5f}      ! VS_RtTq			- Rated torque, [Nm].\n')
+    file.write(f'{rosco_vt["VS_RefSpd"]:<014.5f}      ! VS_RefSpd			- Rated generator speed [rad/s]\n')
+    file.write(f'{int(rosco_vt["VS_n"]):<11d}         ! VS_n				- Number of generator PI torque controller gains\n')
+    file.write(f'{rosco_vt["VS_KP"]:<014.5f}      ! VS_KP				- Proportional gain for generator PI torque controller [-]. (Only used in the transitional 2.5 region if VS_ControlMode =/ 2)\n')
+    file.write(f'{rosco_vt["VS_KI"]:<014.5f}      ! VS_KI				- Integral gain for generator PI torque controller [s]. (Only used in the transitional 2.5 region if VS_ControlMode =/ 2)\n')
+    file.write(f'{float(rosco_vt["VS_TSRopt"]):<13.2f}       ! VS_TSRopt		    - {input_descriptions["VS_TSRopt"]}\n')
+    file.write(f'{float(rosco_vt["VS_PwrFiltF"]):<014.5f}      ! VS_PwrFiltF		- {input_descriptions["VS_PwrFiltF"]}\n')
     file.write('\n')
     file.write('!------- SETPOINT SMOOTHER ---------------------------------------------\n')
-    file.write('{:<13.5f}       ! SS_VSGain         - Variable speed torque controller setpoint smoother gain, [-].\n'.format(rosco_vt['SS_VSGain']))
-    file.write('{:<13.5f}       ! SS_PCGain         - Collective pitch controller setpoint smoother gain, [-].\n'.format(rosco_vt['SS_PCGain']))
+    file.write(f'{rosco_vt["SS_VSGain"]:<13.5f}       ! SS_VSGain         - Variable speed torque controller setpoint smoother gain, [-].\n')
+    file.write(f'{rosco_vt["SS_PCGain"]:<13.5f}       ! SS_PCGain         - Collective pitch controller setpoint smoother gain, [-].\n')
     file.write('\n')
     file.write('!------- POWER REFERENCE TRACKING --------------------------------------\n')
-    file.write('{:<11d}         ! PRC_n			    -  Number of elements in PRC_WindSpeeds and PRC_GenSpeeds array\n'.format(int(rosco_vt['PRC_n'])))
-    file.write('{:<13.5f}       ! PRC_LPF_Freq   - {}\n'.format(float(rosco_vt['PRC_LPF_Freq']), input_descriptions["PRC_LPF_Freq"]))
-    file.write('{}     ! PRC_WindSpeeds   - {}\n'.format(write_array(rosco_vt["PRC_WindSpeeds"]), input_descriptions["PRC_WindSpeeds"]))
-    file.write('{}      ! PRC_GenSpeeds   - {}\n'.format(write_array(rosco_vt["PRC_GenSpeeds"]), input_descriptions["PRC_GenSpeeds"]))
+    file.write(f'{int(rosco_vt["PRC_n"]):<11d}         ! PRC_n			    -  Number of elements in PRC_WindSpeeds and PRC_GenSpeeds array\n')
+    file.write(f'{float(rosco_vt["PRC_LPF_Freq"]):<13.5f}       ! PRC_LPF_Freq   - {input_descriptions["PRC_LPF_Freq"]}\n')
+    file.write(f'{write_array(rosco_vt["PRC_WindSpeeds"])}     ! PRC_WindSpeeds   - {input_descriptions["PRC_WindSpeeds"]}\n')
+    file.write(f'{write_array(rosco_vt["PRC_GenSpeeds"])}      ! PRC_GenSpeeds   - {input_descriptions["PRC_GenSpeeds"]}\n')
     file.write('\n')
     file.write('!------- WIND SPEED ESTIMATOR ---------------------------------------------\n')
-    file.write('{:<13.3f}       ! WE_BladeRadius	- Blade length (distance from hub center to blade tip), [m]\n'.format(rosco_vt['WE_BladeRadius']))
-    file.write('{:<11d}         ! WE_CP_n			- Amount of parameters in the Cp array\n'.format(int(rosco_vt['WE_CP_n'])))
-    file.write('{:<13.1f}       ! WE_CP - Parameters that define the parameterized CP(lambda) function\n'.format(rosco_vt['WE_CP']))
-    file.write('{:<13.1f}		  ! WE_Gamma			- Adaption gain of the wind speed estimator algorithm [m/rad]\n'.format(rosco_vt['WE_Gamma']))
-    file.write('{:<13.1f}       ! WE_GearboxRatio	- Gearbox ratio [>=1],  [-]\n'.format(rosco_vt['WE_GearboxRatio']))
-    file.write('{:<14.5f}     ! WE_Jtot			- Total drivetrain inertia, including blades, hub and casted generator inertia to LSS, [kg m^2]\n'.format(rosco_vt['WE_Jtot']))
-    file.write('{:<13.3f}       ! WE_RhoAir			- Air density, [kg m^-3]\n'.format(rosco_vt['WE_RhoAir']))
-    file.write(      '"{}"      ! PerfFileName      - File containing rotor performance tables (Cp,Ct,Cq) (absolute path or relative to this file)\n'.format(rosco_vt['PerfFileName']))
-    file.write('{:<7d} {:<10d}  ! PerfTableSize     - Size of rotor performance tables, first number refers to number of blade pitch angles, second number referse to number of tip-speed ratios\n'.format(int(rosco_vt['PerfTableSize'][0]),int(rosco_vt['PerfTableSize'][1])))
-    file.write('{:<11d}         ! WE_FOPoles_N      - Number of first-order system poles used in EKF\n'.format(int(rosco_vt['WE_FOPoles_N'])))
-    file.write('{}              ! WE_FOPoles_v      - Wind speeds corresponding to first-order system poles [m/s]\n'.format(''.join('{:<4.4f} '.format(rosco_vt['WE_FOPoles_v'][i]) for i in range(len(rosco_vt['WE_FOPoles_v'])))))
-    file.write('{}              ! WE_FOPoles        - First order system poles [1/s]\n'.format(''.join('{:<10.8f} '.format(rosco_vt['WE_FOPoles'][i]) for i in range(len(rosco_vt['WE_FOPoles'])))))
+    file.write(f'{rosco_vt["WE_BladeRadius"]:<13.3f}       ! WE_BladeRadius	- Blade length (distance from hub center to blade tip), [m]\n')
+    file.write(f'{int(rosco_vt["WE_CP_n"]):<11d}         ! WE_CP_n			- Amount of parameters in the Cp array\n')
+    file.write(f'{rosco_vt["WE_CP"]:<13.1f}       ! WE_CP - Parameters that define the parameterized CP(lambda) function\n')
+    file.write(f'{rosco_vt["WE_Gamma"]:<13.1f}		  ! WE_Gamma			- Adaption gain of the wind speed estimator algorithm [m/rad]\n')
+    file.write(f'{rosco_vt["WE_GearboxRatio"]:<13.1f}       ! WE_GearboxRatio	- Gearbox ratio [>=1],  [-]\n')
+    file.write(f'{rosco_vt["WE_Jtot"]:<14.5f}     ! WE_Jtot			- Total drivetrain inertia, including blades, hub and casted generator inertia to LSS, [kg m^2]\n')
+    file.write(f'{rosco_vt["WE_RhoAir"]:<13.3f}       ! WE_RhoAir			- Air density, [kg m^-3]\n')
+    file.write(      f'"{rosco_vt["PerfFileName"]}"      ! PerfFileName      - File containing rotor performance tables (Cp,Ct,Cq) (absolute path or relative to this file)\n')
+    file.write(f'{int(rosco_vt["PerfTableSize"][0]):<7d} {int(rosco_vt["PerfTableSize"][1]):<10d}  ! PerfTableSize     - Size of rotor performance tables, first number refers to number of blade pitch angles, second number referse to number of tip-speed ratios\n')
+    file.write(f'{int(rosco_vt["WE_FOPoles_N"]):<11d}         ! WE_FOPoles_N      - Number of first-order system poles used in EKF\n')
+    file.write(f'{write_array(rosco_vt["WE_FOPoles_v"],"<4.4f",line_width=0)}              ! WE_FOPoles_v      - Wind speeds corresponding to first-order system poles [m/s]\n')
+    file.write(f'{write_array(rosco_vt["WE_FOPoles"],"<10.8f",line_width=0)}              ! WE_FOPoles        - First order system poles [1/s]\n')
     file.write('\n')
     file.write('!------- YAW CONTROL ------------------------------------------------------\n')
-    file.write('{:<13.5f}       ! Y_uSwitch		- Wind speed to switch between Y_ErrThresh. If zero, only the second value of Y_ErrThresh is used [m/s]\n'.format(rosco_vt['Y_uSwitch']))
-    file.write('{}! Y_ErrThresh    - Yaw error threshold/deadbands. Turbine begins to yaw when it passes this. If Y_uSwitch is zero, only the second value is used. [deg].\n'.format(''.join('{:<4.6f}  '.format(rosco_vt['Y_ErrThresh'][i]) for i in range(len(rosco_vt['F_FlCornerFreq'])))))
-    file.write('{:<13.5f}       ! Y_Rate			- Yaw rate [rad/s]\n'.format(rosco_vt['Y_Rate']))
-    file.write('{:<13.5f}       ! Y_MErrSet		- Integrator saturation (maximum signal amplitude contribution to pitch from yaw-by-IPC), [rad]\n'.format(rosco_vt['Y_MErrSet']))
-    file.write('{:<13.5f}       ! Y_IPC_IntSat		- Integrator saturation (maximum signal amplitude contribution to pitch from yaw-by-IPC), [rad]\n'.format(rosco_vt['Y_IPC_IntSat']))
-    file.write('{:<13.5f}       ! Y_IPC_KP			- Yaw-by-IPC proportional controller gain Kp\n'.format(rosco_vt['Y_IPC_KP']))
-    file.write('{:<13.5f}       ! Y_IPC_KI			- Yaw-by-IPC integral controller gain Ki\n'.format(rosco_vt['Y_IPC_KI']))
+    file.write(f'{rosco_vt["Y_uSwitch"]:<13.5f}       ! Y_uSwitch		- Wind speed to switch between Y_ErrThresh. If zero, only the second value of Y_ErrThresh is used [m/s]\n')
+    file.write(f'{write_array(rosco_vt["Y_ErrThresh"],"<4.6f",sep="  ",line_width=0)}! Y_ErrThresh    - Yaw error threshold/deadbands. Turbine begins to yaw when it passes this. If Y_uSwitch is zero, only the second value is used. [deg].\n')
+    file.write(f'{rosco_vt["Y_Rate"]:<13.5f}       ! Y_Rate			- Yaw rate [rad/s]\n')
+    file.write(f'{rosco_vt["Y_MErrSet"]:<13.5f}       ! Y_MErrSet		- Integrator saturation (maximum signal amplitude contribution to pitch from yaw-by-IPC), [rad]\n')
+    file.write(f'{rosco_vt["Y_IPC_IntSat"]:<13.5f}       ! Y_IPC_IntSat		- Integrator saturation (maximum signal amplitude contribution to pitch from yaw-by-IPC), [rad]\n')
+    file.write(f'{rosco_vt["Y_IPC_KP"]:<13.5f}       ! Y_IPC_KP			- Yaw-by-IPC proportional controller gain Kp\n')
+    file.write(f'{rosco_vt["Y_IPC_KI"]:<13.5f}       ! Y_IPC_KI			- Yaw-by-IPC integral controller gain Ki\n')
     file.write('\n')
     file.write('!------- TOWER CONTROL ------------------------------------------------------\n')
-    file.write('{:<13.5f}       ! TRA_ExclSpeed	    - {}\n'.format(rosco_vt['TRA_ExclSpeed'], input_descriptions['TRA_ExclSpeed'] ))
-    file.write('{:<13.5f}       ! TRA_ExclBand	    - {}\n'.format(rosco_vt['TRA_ExclBand'], input_descriptions['TRA_ExclBand'] ))
-    file.write('{:<13.5e}       ! TRA_RateLimit	    - {}\n'.format(rosco_vt['TRA_RateLimit'], input_descriptions['TRA_RateLimit'] ))
-    file.write('{:<13.5f}       ! FA_KI				- Integral gain for the fore-aft tower damper controller,  [rad*s/m]\n'.format(rosco_vt['FA_KI'] ))
-    file.write('{:<13.5f}       ! FA_HPFCornerFreq	- Corner frequency (-3dB point) in the high-pass filter on the fore-aft acceleration signal [rad/s]\n'.format(rosco_vt['FA_HPFCornerFreq'] ))
-    file.write('{:<13.5f}       ! FA_IntSat			- Integrator saturation (maximum signal amplitude contribution to pitch from FA damper), [rad]\n'.format(rosco_vt['FA_IntSat'] ))
+    file.write(f'{rosco_vt["TRA_ExclSpeed"]:<13.5f}       ! TRA_ExclSpeed	    - {input_descriptions["TRA_ExclSpeed"]}\n')
+    file.write(f'{rosco_vt["TRA_ExclBand"]:<13.5f}       ! TRA_ExclBand	    - {input_descriptions["TRA_ExclBand"]}\n')
+    file.write(f'{rosco_vt["TRA_RateLimit"]:<13.5e}       ! TRA_RateLimit	    - {input_descriptions["TRA_RateLimit"]}\n')
+    file.write(f'{rosco_vt["FA_KI"]:<13.5f}       ! FA_KI				- Integral gain for the fore-aft tower damper controller,  [rad*s/m]\n')
+    file.write(f'{rosco_vt["FA_HPFCornerFreq"]:<13.5f}       ! FA_HPFCornerFreq	- Corner frequency (-3dB point) in the high-pass filter on the fore-aft acceleration signal [rad/s]\n')
+    file.write(f'{rosco_vt["FA_IntSat"]:<13.5f}       ! FA_IntSat			- Integrator saturation (maximum signal amplitude contribution to pitch from FA damper), [rad]\n')
     file.write('\n')
     file.write('!------- MINIMUM PITCH SATURATION -------------------------------------------\n')
-    file.write('{:<11d}         ! PS_BldPitchMin_N  - Number of values in minimum blade pitch lookup table (should equal number of values in PS_WindSpeeds and PS_BldPitchMin)\n'.format(int(rosco_vt['PS_BldPitchMin_N'])))
-    file.write('{}              ! PS_WindSpeeds     - Wind speeds corresponding to minimum blade pitch angles [m/s]\n'.format(''.join('{:<4.3f} '.format(rosco_vt['PS_WindSpeeds'][i]) for i in range(len(rosco_vt['PS_WindSpeeds'])))))
-    file.write('{}              ! PS_BldPitchMin    - Minimum blade pitch angles [rad]\n'.format(''.join('{:<10.3f} '.format(rosco_vt['PS_BldPitchMin'][i]) for i in range(len(rosco_vt['PS_BldPitchMin'])))))
+    file.write(f'{int(rosco_vt["PS_BldPitchMin_N"]):<11d}         ! PS_BldPitchMin_N  - Number of values in minimum blade pitch lookup table (should equal number of values in PS_WindSpeeds and PS_BldPitchMin)\n')
+    file.write(f'{write_array(rosco_vt["PS_WindSpeeds"],"<4.3f",line_width=0)}              ! PS_WindSpeeds     - Wind speeds corresponding to minimum blade pitch angles [m/s]\n')
+    file.write(f'{write_array(rosco_vt["PS_BldPitchMin"],"<10.3f",line_width=0)}              ! PS_BldPitchMin    - Minimum blade pitch angles [rad]\n')
     file.write('\n')
     file.write('!------- SHUTDOWN -----------------------------------------------------------\n')
-    file.write('{:<014.5f}      ! SD_MaxPit         - Maximum blade pitch angle to initiate shutdown, [rad]\n'.format(rosco_vt['SD_MaxPit']))
-    file.write('{:<014.5f}      ! SD_CornerFreq     - Cutoff Frequency for first order low-pass filter for blade pitch angle, [rad/s]\n'.format(rosco_vt['SD_CornerFreq']))
+    file.write(f'{rosco_vt["SD_MaxPit"]:<014.5f}      ! SD_MaxPit         - Maximum blade pitch angle to initiate shutdown, [rad]\n')
+    file.write(f'{rosco_vt["SD_CornerFreq"]:<014.5f}      ! SD_CornerFreq     - Cutoff Frequency for first order low-pass filter for blade pitch angle, [rad/s]\n')
     file.write('\n')
     file.write('!------- Floating -----------------------------------------------------------\n')
     if rosco_vt['Fl_Mode'] == 2:
         floatstr = 'pitching'
     else:
         floatstr = 'velocity'
-    file.write('{:<11d}         ! Fl_n              - Number of Fl_Kp gains in gain scheduling, optional with default of 1\n'.format(int(rosco_vt['Fl_n'])))
-    file.write('{}        ! Fl_Kp             - Nacelle {} proportional feedback gain [s]\n'.format(write_array(rosco_vt['Fl_Kp'],'<6.4f'), floatstr))
-    file.write('{}        ! Fl_U              - Wind speeds for scheduling Fl_Kp, optional if Fl_Kp is single value [m/s]\n'.format(write_array(rosco_vt['Fl_U'],'<6.4f')))
+    file.write(f'{int(rosco_vt["Fl_n"]):<11d}         ! Fl_n              - Number of Fl_Kp gains in gain scheduling, optional with default of 1\n')
+    file.write(f'{write_array(rosco_vt["Fl_Kp"],"<6.4f")}        ! Fl_Kp             - Nacelle {floatstr} proportional feedback gain [s]\n')
+    file.write(f'{write_array(rosco_vt["Fl_U"],"<6.4f")}        ! Fl_U              - Wind speeds for scheduling Fl_Kp, optional if Fl_Kp is single value [m/s]\n')
     file.write('\n')
     file.write('!------- FLAP ACTUATION -----------------------------------------------------\n')
-    file.write('{:<014.5f}      ! Flp_Angle         - Initial or steady state flap angle [rad]\n'.format(rosco_vt['Flp_Angle']))
-    file.write('{:<014.8e}      ! Flp_Kp            - Blade root bending moment proportional gain for flap control [s]\n'.format(rosco_vt['Flp_Kp']))
-    file.write('{:<014.8e}      ! Flp_Ki            - Flap displacement integral gain for flap control [-]\n'.format(rosco_vt['Flp_Ki']))
-    file.write('{:<014.5f}      ! Flp_MaxPit        - Maximum (and minimum) flap pitch angle [rad]\n'.format(rosco_vt['Flp_MaxPit']))
+    file.write(f'{rosco_vt["Flp_Angle"]:<014.5f}      ! Flp_Angle         - Initial or steady state flap angle [rad]\n')
+    file.write(f'{rosco_vt["Flp_Kp"]:<014.8e}      ! Flp_Kp            - Blade root bending moment proportional gain for flap control [s]\n')
+    file.write(f'{rosco_vt["Flp_Ki"]:<014.8e}      ! Flp_Ki            - Flap displacement integral gain for flap control [-]\n')
+    file.write(f'{rosco_vt["Flp_MaxPit"]:<014.5f}      ! Flp_MaxPit        - Maximum (and minimum) flap pitch angle [rad]\n')
     file.write('\n')
     file.write('!------- Open Loop Control -----------------------------------------------------\n')
-    file.write('"{}"            ! OL_Filename       - Input file with open loop timeseries (absolute path or relative to this file)\n'.format(rosco_vt['OL_Filename']))
-    file.write('{0:<12d}        ! Ind_Breakpoint    - The column in OL_Filename that contains the breakpoint (time if OL_Mode = 1)\n'.format(int(rosco_vt['Ind_Breakpoint'])))
-    file.write('{}         ! Ind_BldPitch      - The columns in OL_Filename that contains the blade pitch (1,2,3) inputs in rad [array]\n'.format(' '.join([f'{int(ipb):3d}' for ipb in rosco_vt['Ind_BldPitch']])))
-    file.write('{0:<12d}        ! Ind_GenTq         - The column in OL_Filename that contains the generator torque in Nm\n'.format(int(rosco_vt['Ind_GenTq'])))
-    file.write('{0:<12d}        ! Ind_YawRate       - The column in OL_Filename that contains the yaw rate in rad/s\n'.format(int(rosco_vt['Ind_YawRate'])))
-    file.write('{:<12d}        ! Ind_Azimuth       - {}\n'.format(int(rosco_vt["Ind_Azimuth"]), input_descriptions["Ind_Azimuth"]))
-    file.write('{}        ! {} - {}\n'.format(' '.join([f'{g:02.4f}' for g in rosco_vt["RP_Gains"]]),"RP_Gains",input_descriptions["RP_Gains"]))
-    file.write('{}        ! Ind_CableControl  - The column(s) in OL_Filename that contains the cable control inputs in m [Used with CC_Mode = 2, must be the same size as CC_Group_N]\n'.format(write_array(rosco_vt['Ind_CableControl'],'<4d')))
-    file.write('{}        ! Ind_StructControl - The column(s) in OL_Filename that contains the structural control inputs [Used with StC_Mode = 2, must be the same size as StC_Group_N]\n'.format(write_array(rosco_vt['Ind_StructControl'],'<4d')))
+    file.write(f'"{rosco_vt["OL_Filename"]}"            ! OL_Filename       - Input file with open loop timeseries (absolute path or relative to this file)\n')
+    file.write(f'{int(rosco_vt["Ind_Breakpoint"]):<12d}        ! Ind_Breakpoint    - The column in OL_Filename that contains the breakpoint (time if OL_Mode = 1)\n')
+    file.write(f'{" ".join([f"{int(ipb):3d}" for ipb in rosco_vt["Ind_BldPitch"]])}         ! Ind_BldPitch      - The columns in OL_Filename that contains the blade pitch (1,2,3) inputs in rad [array]\n')
+    file.write(f'{int(rosco_vt["Ind_GenTq"]):<12d}        ! Ind_GenTq         - The column in OL_Filename that contains the generator torque in Nm\n')
+    file.write(f'{int(rosco_vt["Ind_YawRate"]):<12d}        ! Ind_YawRate       - The column in OL_Filename that contains the yaw rate in rad/s\n')
+    file.write(f'{int(rosco_vt["Ind_Azimuth"]):<12d}        ! Ind_Azimuth       - {input_descriptions["Ind_Azimuth"]}\n')
+    file.write(f'{" ".join([f"{g:02.4f}" for g in rosco_vt["RP_Gains"]])}        ! RP_Gains - {input_descriptions["RP_Gains"]}\n')
+    file.write(f'{write_array(rosco_vt["Ind_CableControl"],"<4d")}        ! Ind_CableControl  - The column(s) in OL_Filename that contains the cable control inputs in m [Used with CC_Mode = 2, must be the same size as CC_Group_N]\n')
+    file.write(f'{write_array(rosco_vt["Ind_StructControl"],"<4d")}        ! Ind_StructControl - The column(s) in OL_Filename that contains the structural control inputs [Used with StC_Mode = 2, must be the same size as StC_Group_N]\n')
     file.write('\n')
     file.write('!------- Pitch Actuator Model -----------------------------------------------------\n')
-    file.write('{:<014.5f}       ! PA_CornerFreq     - Pitch actuator bandwidth/cut-off frequency [rad/s]\n'.format(rosco_vt['PA_CornerFreq']))
-    file.write('{:<014.5f}       ! PA_Damping        - Pitch actuator damping ratio [-, unused if PA_Mode = 1]\n'.format(rosco_vt['PA_Damping']))
+    file.write(f'{rosco_vt["PA_CornerFreq"]:<014.5f}       ! PA_CornerFreq     - Pitch actuator bandwidth/cut-off frequency [rad/s]\n')
+    file.write(f'{rosco_vt["PA_Damping"]:<014.5f}       ! PA_Damping        - Pitch actuator damping ratio [-, unused if PA_Mode = 1]\n')
     file.write('\n')
     file.write('!------- Pitch Actuator Faults -----------------------------------------------------\n')
-    file.write('{}                ! PF_Offsets     - Constant blade pitch offsets for blades 1-3 [rad]\n'.format(''.join('{:<10.8f} '.format(rosco_vt['PF_Offsets'][i]) for i in range(3))))
+    file.write(f'{write_array(rosco_vt["PF_Offsets"][:3],"<10.8f",line_width=0)}                ! PF_Offsets     - Constant blade pitch offsets for blades 1-3 [rad]\n')
     file.write('\n')
     file.write('!------- Active Wake Control -----------------------------------------------------\n')
-    file.write('{0:<12d}        ! AWC_NumModes       - Number of user-defined AWC forcing modes \n'.format(int(rosco_vt['AWC_NumModes'])))
-    file.write('{}        ! AWC_n              - Azimuthal mode number(s) (i.e., the number and direction of the lobes of the wake structure)\n'.format(write_array(rosco_vt['AWC_n'],'<4d')))
-    file.write('{}        ! AWC_harmonic       - Harmonic(s) to apply in the AWC Inverse Coleman Transformation (only used when AWC_Mode = 2)\n'.format(write_array(rosco_vt['AWC_harmonic'],'<4d')))
-    file.write('{}        ! AWC_freq           - Frequency(s) of forcing mode(s) [Hz]\n'.format(write_array(rosco_vt['AWC_freq'],'<6.4f')))
-    file.write('{}        ! AWC_amp            - Pitch amplitude(s) of individual forcing mode(s) [deg]\n'.format(write_array(rosco_vt['AWC_amp'],'<6.4f')))
-    file.write('{}        ! AWC_clockangle     - Initial angle(s) of forcing mode(s) [deg]\n'.format(write_array(rosco_vt['AWC_clockangle'],'<6.4f')))
+    file.write(f'{int(rosco_vt["AWC_NumModes"]):<12d}        ! AWC_NumModes       - Number of user-defined AWC forcing modes \n')
+    file.write(f'{write_array(rosco_vt["AWC_n"],"<4d")}        ! AWC_n              - Azimuthal mode number(s) (i.e., the number and direction of the lobes of the wake structure)\n')
+    file.write(f'{write_array(rosco_vt["AWC_harmonic"],"<4d")}        ! AWC_harmonic       - Harmonic(s) to apply in the AWC Inverse Coleman Transformation (only used when AWC_Mode = 2)\n')
+    file.write(f'{write_array(rosco_vt["AWC_freq"],"<6.4f")}        ! AWC_freq           - Frequency(s) of forcing mode(s) [Hz]\n')
+    file.write(f'{write_array(rosco_vt["AWC_amp"],"<6.4f")}        ! AWC_amp            - Pitch amplitude(s) of individual forcing mode(s) [deg]\n')
+    file.write(f'{write_array(rosco_vt["AWC_clockangle"],"<6.4f")}        ! AWC_clockangle     - Initial angle(s) of forcing mode(s) [deg]\n')
     file.write('\n')
     file.write('!------- External Controller Interface -----------------------------------------------------\n')
-    file.write('"{}"            ! DLL_FileName        - Name/location of the dynamic library in the Bladed-DLL format\n'.format(rosco_vt['DLL_FileName']))
-    file.write('"{}"            ! DLL_InFile          - Name of input file sent to the DLL (-)\n'.format(rosco_vt['DLL_InFile']))
-    file.write('"{}"            ! DLL_ProcName        - Name of procedure in DLL to be called (-) \n'.format(rosco_vt['DLL_ProcName']))    
+    file.write(f'"{rosco_vt["DLL_FileName"]}"            ! DLL_FileName        - Name/location of the dynamic library in the Bladed-DLL format\n')
+    file.write(f'"{rosco_vt["DLL_InFile"]}"            ! DLL_InFile          - Name of input file sent to the DLL (-)\n')
+    file.write(f'"{rosco_vt["DLL_ProcName"]}"            ! DLL_ProcName        - Name of procedure in DLL to be called (-) \n')    
     file.write('\n')
     file.write('!------- ZeroMQ Interface ---------------------------------------------------------\n')
-    file.write('"{}"            ! ZMQ_CommAddress     - {} \n'.format(rosco_vt['ZMQ_CommAddress'],input_descriptions['ZMQ_CommAddress']))
-    file.write('{:<11f}         ! ZMQ_UpdatePeriod    - {}\n'.format(rosco_vt['ZMQ_UpdatePeriod'],input_descriptions['ZMQ_UpdatePeriod']))
-    file.write('{:<11d}         ! ZMQ_ID       - {}\n'.format(int(rosco_vt['ZMQ_ID']),input_descriptions['ZMQ_ID']))
+    file.write(f'"{rosco_vt["ZMQ_CommAddress"]}"            ! ZMQ_CommAddress     - {input_descriptions["ZMQ_CommAddress"]} \n')
+    file.write(f'{rosco_vt["ZMQ_UpdatePeriod"]:<11f}         ! ZMQ_UpdatePeriod    - {input_descriptions["ZMQ_UpdatePeriod"]}\n')
+    file.write(f'{int(rosco_vt["ZMQ_ID"]):<11d}         ! ZMQ_ID       - {input_descriptions["ZMQ_ID"]}\n')
     file.write('\n')
     file.write('!------- Cable Control ---------------------------------------------------------\n')
-    file.write('{:<11d}         ! CC_Group_N        - {}\n'.format(len(rosco_vt['CC_GroupIndex']), input_descriptions['CC_Group_N']))
-    file.write('{:^11s}        ! CC_GroupIndex     - {}\n'.format(write_array(rosco_vt['CC_GroupIndex'],'<6d'), input_descriptions['CC_GroupIndex']))
-    file.write('{:<11f}         ! CC_ActTau         - {}\n'.format(rosco_vt['CC_ActTau'], input_descriptions['CC_ActTau']  ))
+    file.write(f'{len(rosco_vt["CC_GroupIndex"]):<11d}         ! CC_Group_N        - {input_descriptions["CC_Group_N"]}\n')
+    file.write(f'{write_array(rosco_vt["CC_GroupIndex"],"<6d"):^11s}        ! CC_GroupIndex     - {input_descriptions["CC_GroupIndex"]}\n')
+    file.write(f'{rosco_vt["CC_ActTau"]:<11f}         ! CC_ActTau         - {input_descriptions["CC_ActTau"]}\n')
     file.write('\n')
     file.write('!------- Structural Controllers ---------------------------------------------------------\n')
-    file.write('{:<11d}         ! StC_Group_N       - {}\n'.format(len(rosco_vt['StC_GroupIndex']), input_descriptions['StC_Group_N']))
-    file.write('{:^11s}        ! StC_GroupIndex    - {}\n'.format(write_array(rosco_vt['StC_GroupIndex'],'<6d'), input_descriptions['StC_GroupIndex']))
+    file.write(f'{len(rosco_vt["StC_GroupIndex"]):<11d}         ! StC_Group_N       - {input_descriptions["StC_Group_N"]}\n')
+    file.write(f'{write_array(rosco_vt["StC_GroupIndex"],"<6d"):^11s}        ! StC_GroupIndex    - {input_descriptions["StC_GroupIndex"]}\n')
     
+    with open(param_file,'w') as f:
+        f.write(file.getvalue())
     file.close()
 
     # Write Open loop input
@@ -706,7 +710,21 @@ def list_check(x, return_bool=True):
     else:
         return y
 
-def write_array(array,format='<.4f',line_width=12):
+def write_array(array,format='<.4f',line_width=12,sep=' '):
+    '''
+    Format an array as a single line of text for a DISCON.IN input
+
+    Parameters:
+    -----------
+        array: float, list, or np.ndarray
+            values to write
+        format: str, optional
+            format specification applied to each value
+        line_width: int, optional
+            minimum width of the returned string, padded with spaces
+        sep: str, optional
+            separator written after each value
+    '''
 
     if not hasattr(array,'__len__'):  #not an array
         array = [array]
@@ -715,4 +733,4 @@ def write_array(array,format='<.4f',line_width=12):
     if 'd' in format and type(array[0]) != int:
         array = [int(a) for a in array]
 
-    return ''.join(['{:{}} '.format(item,format) for item in array]).ljust(line_width)
+    return ''.join([f'{item:{format}}{sep}' for item in array]).ljust(line_width)